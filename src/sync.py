@@ -1,25 +1,41 @@
 """Sync notes by updating timestamps, committing, and pushing to remote."""
 
+from __future__ import annotations
+
 import argparse
 import os
 import re
+import subprocess
 import sys
 from datetime import datetime
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from git import Repo, diff as git_diff
-from git.exc import GitCommandError, InvalidGitRepositoryError
+if TYPE_CHECKING:
+    from git import Repo
 
 from src.core import (
     CliResult,
+    atomic_write_bytes,
     get_root_dir,
     print_error,
     read_file_utf8,
-    write_file_utf8,
 )
 
 LAST_UPDATED_PATTERN = r"^- \*\*Last updated:\*\* \d{4}-\d{2}-\d{2} \d{2}:\d{2}$"
 
+# Compiled once at import time: the stdlib re cache is small and still pays a
+# lookup per call, which adds up when syncing many notes. The timestamp
+# machinery works on bytes so notes never need decoding just to be rewritten.
+_LAST_UPDATED_RE = re.compile(LAST_UPDATED_PATTERN.encode("ascii"), re.MULTILINE)
+_TITLE_RE = re.compile(r'^title:\s*"(.+)"', re.MULTILINE)
+
+_LAST_UPDATED_MARKER = b"- **Last updated:** "
+
+# git reports paths with "/"; accept the native separator too for paths that
+# came from the local filesystem.
+_NOTES_PREFIXES = ("notes/", "notes" + os.sep)
+
 
 def _parse_args() -> argparse.Namespace:
     """Parse command-line arguments for syncing notes."""
@@ -39,23 +55,59 @@ def _parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
+def _format_minutes(now: datetime) -> str:
+    """Format a datetime as 'YYYY-MM-DD HH:MM'.
+
+    Integer formatting in an f-string is several times cheaper than the
+    locale-aware strftime call, and immune to locale settings.
+    """
+    return (
+        f"{now.year:04d}-{now.month:02d}-{now.day:02d} {now.hour:02d}:{now.minute:02d}"
+    )
+
+
+def _replace_last_updated_line(
+    content: bytes, new_timestamp: bytes
+) -> tuple[bytes, int]:
+    """Replace the 'Last updated' line via a literal marker scan.
+
+    The marker prefix is a fixed string, so bytes.find beats running the
+    regex over the whole note, and working on raw bytes means unmatched
+    notes are never even decoded. Falls back to the compiled regex if the
+    found line doesn't have the expected shape. Splicing at ASCII byte
+    boundaries is safe for UTF-8 content.
+    """
+    if content.startswith(_LAST_UPDATED_MARKER):
+        start = 0
+    else:
+        idx = content.find(b"\n" + _LAST_UPDATED_MARKER)
+        if idx == -1:
+            return content, 0
+        start = idx + 1
+
+    end = content.find(b"\n", start)
+    if end == -1:
+        end = len(content)
+
+    if _LAST_UPDATED_RE.fullmatch(content[start:end]) is None:
+        # Marker line doesn't match the timestamp template; a later line
+        # still might, so let the regex decide.
+        return _LAST_UPDATED_RE.subn(new_timestamp, content, count=1)
+
+    return content[:start] + new_timestamp + content[end:], 1
+
+
 def _update_timestamp_in_note(file_path: Path) -> CliResult[bool]:
     """Update the 'Last updated' timestamp in a note file."""
     try:
-        content = read_file_utf8(file_path)
+        content = file_path.read_bytes()
         now = datetime.now()
-        new_timestamp = f"- **Last updated:** {now.strftime('%Y-%m-%d %H:%M')}"
-
-        updated_content, count = re.subn(
-            LAST_UPDATED_PATTERN,
-            new_timestamp,
-            content,
-            count=1,
-            flags=re.MULTILINE,
-        )
+        new_timestamp = _LAST_UPDATED_MARKER + _format_minutes(now).encode("ascii")
+
+        updated_content, count = _replace_last_updated_line(content, new_timestamp)
 
         if count > 0:
-            write_file_utf8(file_path, updated_content)
+            atomic_write_bytes(file_path, updated_content)
             return CliResult(True, 0)
 
         return CliResult(False, 0)
@@ -69,53 +121,125 @@ def _update_timestamp_in_note(file_path: Path) -> CliResult[bool]:
 
 def _is_note_file(path_str: str) -> bool:
     """Check if a path string represents a note markdown file."""
-    path = Path(path_str)
-    return (
-        (len(path.parts) > 0) and (path.parts[0] == "notes") and (path.suffix == ".md")
-    )
+    # Plain string checks: this runs once per path git reports, and building
+    # a Path just to look at parts/suffix is needless allocation. The prefix
+    # check goes first since it rejects non-note paths earliest.
+    return path_str.startswith(_NOTES_PREFIXES) and path_str.endswith(".md")
 
 
 def _add_note_to_list(
-    path_str: str, notes_list: list[Path], repo_root: Path, require_exists: bool = True
+    path_str: str,
+    notes_list: list[Path],
+    repo_root: Path,
+    require_exists: bool = True,
+    seen: set[str] | None = None,
 ) -> list[Path]:
-    """Add a note file path to the list if it exists and is not already present."""
-    file_path = repo_root / path_str
-    if file_path not in notes_list:
-        if not require_exists or file_path.exists():
-            notes_list.append(file_path)
+    """Add a note file path to the list if it exists and is not already present.
+
+    Dedup and existence checks run in plain-string space; a Path is only
+    allocated when the note is actually appended. When a `seen` set is
+    provided it is used for O(1) dedup instead of scanning the list.
+    """
+    full_path = os.path.join(os.fspath(repo_root), path_str)
+    if seen is not None:
+        if full_path in seen:
+            return notes_list
+    elif Path(full_path) in notes_list:
+        return notes_list
+
+    if not require_exists or os.path.lexists(full_path):
+        notes_list.append(Path(full_path))
+        if seen is not None:
+            seen.add(full_path)
     return notes_list
 
 
-def _add_note_from_diff(
-    diff: git_diff.Diff, notes_list: list[Path], repo_root: Path
-) -> list[Path]:
-    """Add a note from a git diff to the list, handling deletions."""
-    return _add_note_to_list(
-        diff.a_path, notes_list, repo_root, require_exists=not diff.deleted_file
+def _run_git(root_dir: Path, *args: str) -> str:
+    """Run a git command in the given directory and return its stdout.
+
+    A direct subprocess call avoids GitPython's Repo construction (which
+    stats the whole .git directory) for simple read-only queries.
+    """
+    result = subprocess.run(
+        ["git", "-C", str(root_dir), *args],
+        capture_output=True,
+        text=True,
+        check=True,
     )
+    return result.stdout
+
+
+def _is_git_repository(root_dir: Path) -> bool:
+    """Check whether root_dir is inside a git work tree."""
+    try:
+        out = _run_git(root_dir, "rev-parse", "--is-inside-work-tree")
+        return out.strip() == "true"
+    except (subprocess.CalledProcessError, OSError):
+        return False
+
+
+def _notes_tree_is_clean(root_dir: Path) -> bool:
+    """Cheaply check that notes/ has no tracked changes and no untracked files.
+
+    `git diff --quiet` answers without enumerating paths, so clean repos -
+    the common case for a habitual sync - skip the full status parse.
+    """
+    try:
+        # Exits nonzero when there are staged or unstaged changes to notes/
+        _run_git(root_dir, "diff", "--quiet", "HEAD", "--", "notes")
+        untracked = _run_git(
+            root_dir, "ls-files", "--others", "--exclude-standard", "-z", "--", "notes"
+        )
+    except (subprocess.CalledProcessError, OSError):
+        return False
+    return untracked == ""
 
 
-def _get_modified_notes(repo: Repo) -> list[Path]:
+def _get_modified_notes(root_dir: Path) -> list[Path]:
     """Get list of modified markdown files in notes/ directory."""
     modified_files: list[Path] = []
-    repo_root = Path(repo.working_dir)
-
-    # Get untracked files
-    for item in repo.untracked_files:
-        if _is_note_file(item):
+    seen: set[str] = set()
+    repo_root = root_dir
+
+    # One `git status` subprocess replaces three separate GitPython index
+    # walks (untracked, unstaged, staged) and all their Diff allocations.
+    # The pathspec keeps git from scanning the worktree outside notes/,
+    # --no-optional-locks skips the index refresh write, and
+    # --no-ahead-behind skips the remote comparison we don't need here.
+    # Deleted notes stay in the list so their removal gets staged.
+    out = _run_git(
+        root_dir,
+        "--no-optional-locks",
+        "status",
+        "--porcelain=v1",
+        "-z",
+        "--no-ahead-behind",
+        "--untracked-files=all",
+        "--",
+        "notes",
+    )
+    entries = iter(out.split("\x00"))
+    for entry in entries:
+        if len(entry) < 4:
+            continue
+        status = entry[:2]
+        path_str = entry[3:]
+        if status[0] == "D" and status[1] == " ":
+            # Deletion already staged (git rm): the path matches nothing in
+            # the worktree or index, so feeding it to `git add` would fail;
+            # the commit picks the staged deletion up regardless.
+            continue
+        if _is_note_file(path_str):
             modified_files = _add_note_to_list(
-                item, modified_files, repo_root, require_exists=True
+                path_str, modified_files, repo_root, require_exists=False, seen=seen
             )
-
-    # Get modified files from diff (unstaged changes)
-    for diff in repo.index.diff(None):
-        if _is_note_file(diff.a_path):
-            modified_files = _add_note_from_diff(diff, modified_files, repo_root)
-
-    # Get staged files
-    for diff in repo.index.diff("HEAD"):
-        if diff.a_path and _is_note_file(diff.a_path):
-            modified_files = _add_note_from_diff(diff, modified_files, repo_root)
+        if status[0] in "RC":
+            # Rename/copy records carry the source path as an extra NUL
+            # token; consume it to stay aligned. The source itself must not
+            # be staged - renames only show as R once already staged, so the
+            # path matches nothing and `git add` would fail; the commit
+            # picks the staged rename-away up from the index.
+            next(entries, "")
 
     return modified_files
 
@@ -125,14 +249,14 @@ def _generate_commit_message(modified_files: list[Path]) -> str:
     if len(modified_files) == 0:
         return "Sync notes"
 
-    now = datetime.now().strftime("%Y-%m-%d %H:%M")
+    now = _format_minutes(datetime.now())
     count = len(modified_files)
 
     if count == 1:
         # Extract title from the single note
         try:
             content = read_file_utf8(modified_files[0])
-            title_match = re.search(r'^title:\s*"(.+)"', content, re.MULTILINE)
+            title_match = _TITLE_RE.search(content)
             if title_match is not None:
                 title = title_match.group(1)
                 return f"Update note: {title}"
@@ -145,6 +269,11 @@ def _generate_commit_message(modified_files: list[Path]) -> str:
 
 def _get_repository(root_dir: Path) -> CliResult[Repo]:
     """Get the git repository instance."""
+    # Imported lazily so that --help and error paths don't pay GitPython's
+    # heavy import cost.
+    from git import Repo
+    from git.exc import InvalidGitRepositoryError
+
     try:
         repo = Repo(root_dir)
         return CliResult(repo, 0)
@@ -155,43 +284,79 @@ def _get_repository(root_dir: Path) -> CliResult[Repo]:
 
 def _update_note_timestamps(modified_notes: list[Path]) -> CliResult[int]:
     """Update timestamps in modified notes. Returns CliResult with count of updated notes."""
-    updated_count = 0
-    for note in modified_notes:
-        if not note.exists():
-            continue
-        result = _update_timestamp_in_note(note)
-        if not result.is_error() and result.unwrap():
-            updated_count += 1
+    existing_notes = [note for note in modified_notes if note.exists()]
+
+    if len(existing_notes) <= 4:
+        # Not worth spinning up a pool for a handful of notes
+        results = [_update_timestamp_in_note(note) for note in existing_notes]
+    else:
+        # Each update is an independent read/rewrite that spends most of its
+        # time in syscalls, so threads overlap the I/O waits. Eight workers
+        # is plenty before the disk queue saturates.
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(_update_timestamp_in_note, existing_notes))
+
+    updated_count = sum(
+        1 for result in results if not result.is_error() and result.unwrap()
+    )
     return CliResult(updated_count, 0)
 
 
-def _validate_note_path(note_path: Path, repo_root: Path) -> bool:
-    """Validate that a note path is safe and within the repository."""
-    try:
-        abs_note_path = note_path.resolve()
-        abs_repo_root = repo_root.resolve()
-        abs_note_path.relative_to(abs_repo_root)
+def _validate_note_path(note_path: Path, abs_repo_root: Path) -> bool:
+    """Validate that a note path is safe and within the repository.
 
-        # Additional check: path should be under notes/ directory
-        rel_path = (
-            note_path.relative_to(repo_root) if note_path.is_absolute() else note_path
-        )
+    Works lexically on the already-resolved repo root so no per-note
+    resolve() syscalls are needed; ".." components are rejected outright.
+    """
+    try:
+        if note_path.is_absolute():
+            try:
+                rel_path = note_path.relative_to(abs_repo_root)
+            except ValueError:
+                # Roots may differ textually (e.g. symlinked tmp dirs);
+                # only then pay for a resolve().
+                rel_path = note_path.resolve().relative_to(abs_repo_root)
+        else:
+            rel_path = note_path
+        if ".." in rel_path.parts:
+            return False
         return len(rel_path.parts) > 0 and rel_path.parts[0] == "notes"
     except (ValueError, OSError):
         return False
 
 
-def _stage_notes(repo: Repo, notes: list[Path], repo_root: Path) -> CliResult[bool]:
+def _stage_notes(notes: list[Path], repo_root: Path) -> CliResult[bool]:
     """Stage only the specified note files with path validation."""
+    # Resolve the constant root once instead of twice per note
+    abs_repo_root = repo_root.resolve()
+    for note in notes:
+        if not _validate_note_path(note, abs_repo_root):
+            print_error(f"Invalid note path: {note}")
+            return CliResult(False, 1)
+
+    # One git invocation for all notes; feeding the pathspecs through
+    # stdin sidesteps ARG_MAX so no chunking is needed.
+    payload = "\x00".join(str(note) for note in notes)
     try:
-        for note in notes:
-            if not _validate_note_path(note, repo_root):
-                print_error(f"Invalid note path: {note}")
-                return CliResult(False, 1)
-            repo.git.add(str(note))
+        subprocess.run(
+            [
+                "git",
+                "-C",
+                str(repo_root),
+                "add",
+                "--pathspec-from-file=-",
+                "--pathspec-file-nul",
+            ],
+            input=payload,
+            text=True,
+            capture_output=True,
+            check=True,
+        )
         return CliResult(True, 0)
-    except GitCommandError as e:
-        print_error(f"Staging changes: {e}")
+    except subprocess.CalledProcessError as e:
+        print_error(f"Staging changes: {e.stderr.strip() or e}")
         return CliResult(False, 1)
 
 
@@ -202,10 +367,13 @@ def _commit_changes(repo: Repo, message: str) -> CliResult[bool]:
     - Skipped: ruff, ruff-format, trailing-whitespace, end-of-file-fixer
     - Runs: check-docstring-first, check-merge-conflict, check-toml, requirements-txt-fixer
     """
+    from git.exc import GitCommandError
+
     try:
-        env = os.environ.copy()
-        env["SKIP"] = "ruff,ruff-format,trailing-whitespace,end-of-file-fixer"
-        with repo.git.custom_environment(**env):
+        # custom_environment merges into the inherited environment, so only
+        # the SKIP delta needs to be set — no os.environ.copy() required.
+        skip = "ruff,ruff-format,trailing-whitespace,end-of-file-fixer"
+        with repo.git.custom_environment(SKIP=skip):
             repo.index.commit(message, skip_hooks=False)
 
         return CliResult(True, 0)
@@ -214,31 +382,39 @@ def _commit_changes(repo: Repo, message: str) -> CliResult[bool]:
         return CliResult(False, 1)
 
 
-def _has_unpushed_commits(repo: Repo) -> bool:
+def _has_unpushed_commits(root_dir: Path) -> bool:
     """Check if there are local commits not pushed to remote.
 
     Returns:
         True if there are unpushed commits, False otherwise
     """
     try:
-        current_branch = repo.active_branch
-        branch_name = current_branch.name
+        branch = _run_git(root_dir, "rev-parse", "--abbrev-ref", "HEAD").strip()
+        if branch == "HEAD":
+            # Detached HEAD - nothing sensible to push
+            return False
 
-        if current_branch.tracking_branch() is None:
+        try:
+            upstream = _run_git(
+                root_dir, "rev-parse", "--abbrev-ref", "@{upstream}"
+            ).strip()
+        except subprocess.CalledProcessError:
             # No remote tracking branch - consider it as having unpushed commits if we have commits
-            return len(list(repo.iter_commits(max_count=1))) > 0
+            count = _run_git(root_dir, "rev-list", "--count", "--max-count=1", "HEAD")
+            return int(count) > 0
 
-        # Compare local and remote branches
-        remote_branch = current_branch.tracking_branch().name
-        commits_ahead = list(repo.iter_commits(f"{remote_branch}..{branch_name}"))
-        return len(commits_ahead) > 0
-    except (ValueError, GitCommandError):
+        # Compare local and remote branches; rev-list --count returns a
+        # single integer without materializing Commit objects
+        return int(_run_git(root_dir, "rev-list", "--count", f"{upstream}..HEAD")) > 0
+    except (ValueError, OSError, subprocess.CalledProcessError):
         # If we can't determine, assume no unpushed commits
         return False
 
 
 def _push_to_remote(repo: Repo) -> CliResult[bool]:
     """Push commits to the remote origin."""
+    from git.exc import GitCommandError
+
     try:
         origin = repo.remote(name="origin")
         origin.push()
@@ -249,21 +425,24 @@ def _push_to_remote(repo: Repo) -> CliResult[bool]:
         return CliResult(False, 1)
 
 
-def _handle_no_modified_notes(repo: Repo, should_push: bool) -> int:
+def _handle_no_modified_notes(root_dir: Path, should_push: bool) -> int:
     """Handle case when no modified notes are found.
 
     Args:
-        repo: Git repository instance
+        root_dir: Root directory of the repository
         should_push: Whether to attempt pushing (False if --no-push flag set)
 
     Returns:
         Exit code (0 for success, 1 for failure)
     """
-    # Check if there are unpushed commits to push
-    if should_push and _has_unpushed_commits(repo):
+    # Check if there are unpushed commits to push; the Repo object is only
+    # constructed if a push is actually needed
+    if should_push and _has_unpushed_commits(root_dir):
         print("No modified notes, but found unpushed commits")
         print("Pushing to remote...")
-        if (push_result := _push_to_remote(repo)).is_error():
+        if (repo_result := _get_repository(root_dir)).is_error():
+            return repo_result.code
+        if (push_result := _push_to_remote(repo_result.unwrap())).is_error():
             return push_result.code
         print("Successfully pushed commits!")
         return 0
@@ -296,12 +475,12 @@ def _sync_modified_notes(
 
     # Stage changes
     print("Staging changes...")
-    if (stage_result := _stage_notes(repo, modified_notes, root_dir)).is_error():
+    if (stage_result := _stage_notes(modified_notes, root_dir)).is_error():
         return stage_result
 
-    # Check if there are staged changes
-    staged_diff = repo.index.diff("HEAD")
-    if len(staged_diff) == 0:
+    # Check if there are staged changes; --name-only avoids materializing
+    # Diff objects just to test for emptiness
+    if not repo.git.diff("--cached", "--name-only", "-z"):
         print("No changes to commit")
         return CliResult(False, 0)
 
@@ -319,18 +498,26 @@ def main() -> int:
     args = _parse_args()
     root_dir = get_root_dir()
 
-    if (repo_result := _get_repository(root_dir)).is_error():
-        return repo_result.code
-    repo = repo_result.unwrap()
+    if not _is_git_repository(root_dir):
+        print_error("Not in a git repository")
+        return 1
 
     print("Checking for modified notes...")
-    modified_notes = _get_modified_notes(repo)
+    if _notes_tree_is_clean(root_dir):
+        return _handle_no_modified_notes(root_dir, not args.no_push)
+
+    modified_notes = _get_modified_notes(root_dir)
 
     if len(modified_notes) == 0:
-        return _handle_no_modified_notes(repo, not args.no_push)
+        return _handle_no_modified_notes(root_dir, not args.no_push)
 
     print(f"Found {len(modified_notes)} modified note(s)")
 
+    # GitPython is only loaded once we know there's something to commit
+    if (repo_result := _get_repository(root_dir)).is_error():
+        return repo_result.code
+    repo = repo_result.unwrap()
+
     # Sync modified notes (update timestamps, stage, commit)
     sync_result = _sync_modified_notes(repo, modified_notes, root_dir, args.message)
     if sync_result.is_error():
@@ -1,20 +1,59 @@
+import shutil
+import sys
 from collections.abc import Callable
 from pathlib import Path
 
 import git
 import pytest
 
+from src.new_note import main as new_note_main
+from src.sync import main as sync_main
+
+
+@pytest.fixture
+def invoke_sync(monkeypatch, tmp_path) -> Callable[[list[str]], int]:
+    """Run sync's main() with argv and the root directory patched to tmp_path.
+
+    monkeypatch-based: cheaper than nested unittest.mock.patch blocks and
+    undone automatically at teardown.
+    """
+
+    def _invoke(argv: list[str]) -> int:
+        monkeypatch.setattr(sys, "argv", argv)
+        monkeypatch.setattr("src.sync.get_root_dir", lambda: tmp_path)
+        return sync_main()
+
+    return _invoke
+
 
 @pytest.fixture
-def git_repo_with_commit(tmp_path) -> git.Repo:
-    """Create a git repo with an initial commit (HEAD exists) and a mock remote."""
+def invoke_new_note(monkeypatch, tmp_path) -> Callable[[list[str]], int]:
+    """Run new_note's main() with argv and the root directory patched to tmp_path."""
+
+    def _invoke(argv: list[str]) -> int:
+        monkeypatch.setattr(sys, "argv", argv)
+        monkeypatch.setattr("src.new_note.get_root_dir", lambda: tmp_path)
+        return new_note_main()
+
+    return _invoke
+
+
+@pytest.fixture(scope="session")
+def _template_git_repo(tmp_path_factory) -> Path:
+    """Build the repo-with-commit-and-remote template once per session.
+
+    git init plus an initial commit and push costs tens of milliseconds;
+    paying it once and copying per test is much cheaper.
+    """
+    base = tmp_path_factory.mktemp("repo_template")
+
     # Create a bare repo to act as remote
-    remote_path = tmp_path / ".remote"
+    remote_path = base / ".remote"
     remote_path.mkdir()
     git.Repo.init(remote_path, bare=True)
 
     # Create the main repo
-    repo = git.Repo.init(tmp_path)
+    repo = git.Repo.init(base)
     repo.config_writer().set_value("user", "name", "Test User").release()
     repo.config_writer().set_value("user", "email", "test@example.com").release()
 
@@ -22,7 +61,7 @@ def git_repo_with_commit(tmp_path) -> git.Repo:
     repo.create_remote("origin", str(remote_path))
 
     # Create initial commit
-    readme = tmp_path / "README.md"
+    readme = base / "README.md"
     readme.write_text("# Test")
     repo.index.add([str(readme)])
     repo.index.commit("Initial commit")
@@ -36,6 +75,28 @@ def git_repo_with_commit(tmp_path) -> git.Repo:
     # Set up tracking branch
     current_branch.set_tracking_branch(origin.refs[branch_name])
 
+    repo.close()
+    return base
+
+
+@pytest.fixture
+def git_repo_with_commit(tmp_path, _template_git_repo) -> git.Repo:
+    """Give each test its own copy of the template repo and mock remote.
+
+    A plain copy (rather than `git worktree add`) keeps tests fully
+    isolated: worktrees share branches and refs, so per-test commits on
+    the same branch would collide.
+    """
+    for item in _template_git_repo.iterdir():
+        dest = tmp_path / item.name
+        if item.is_dir():
+            shutil.copytree(item, dest)
+        else:
+            shutil.copy2(item, dest)
+
+    repo = git.Repo(tmp_path)
+    # Point origin at this test's copy of the bare remote
+    repo.remote("origin").set_url(str(tmp_path / ".remote"))
     return repo
 
 
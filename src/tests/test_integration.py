@@ -1,23 +1,31 @@
-import sys
-import time
-from unittest.mock import patch
+import io
+import os
+import subprocess
+from contextlib import redirect_stdout
 
-from src.new_note import main as new_note_main
-from src.sync import main as sync_main
+
+def _last_commits(root, n: int) -> list[str]:
+    """Return the newest n commits as 'hash|subject' lines via git log.
+
+    One subprocess per call instead of GitPython materializing Commit
+    objects and parsing headers in Python.
+    """
+    return subprocess.check_output(
+        ["git", "-C", str(root), "log", "-n", str(n), "--format=%H|%s"], text=True
+    ).splitlines()
 
 
 def test_integration_new_note_and_sync(
-    tmp_path, git_repo_with_commit, note_template, capsys
+    tmp_path, git_repo_with_commit, note_template, invoke_new_note, invoke_sync
 ):
     """Full integration test: create note with new_note → sync → modify → sync again."""
     # Step 1: Create a new note using new_note
-    with patch.object(sys, "argv", ["new_note", "Integration Test", "--tags", "test"]):
-        with patch("src.new_note.get_root_dir", return_value=tmp_path):
-            exit_code = new_note_main()
+    buf = io.StringIO()
+    with redirect_stdout(buf):
+        exit_code = invoke_new_note(["new_note", "Integration Test", "--tags", "test"])
 
     assert exit_code == 0
-    captured = capsys.readouterr()
-    assert "Created note:" in captured.out
+    assert "Created note:" in buf.getvalue()
 
     # Find the created note
     notes_dir = tmp_path / "notes"
@@ -34,43 +42,45 @@ def test_integration_new_note_and_sync(
     assert "test" in note_content
 
     # Step 2: First sync (should commit the new note)
-    with patch.object(sys, "argv", ["sync", "--no-push"]):
-        with patch("src.sync.get_root_dir", return_value=tmp_path):
-            exit_code = sync_main()
+    buf = io.StringIO()
+    with redirect_stdout(buf):
+        exit_code = invoke_sync(["sync", "--no-push"])
 
     assert exit_code == 0
-    captured = capsys.readouterr()
-    assert "Found 1 modified note(s)" in captured.out
-    assert "Changes committed" in captured.out
+    output = buf.getvalue()
+    assert "Found 1 modified note(s)" in output
+    assert "Changes committed" in output
 
     # Verify commit was created
-    commits = list(git_repo_with_commit.iter_commits(max_count=2))
+    commits = _last_commits(tmp_path, 2)
     assert len(commits) == 2  # README + sync commit
-    assert "Integration Test" in commits[0].message
+    assert "Integration Test" in commits[0]
 
     # Get timestamp from first sync
     first_sync_content = note_path.read_text()
 
-    # Step 3: Modify the note
-    time.sleep(0.1)  # Ensure timestamp difference
+    # Step 3: Modify the note; bump mtime explicitly instead of sleeping
+    # so the change can't hide behind git's stat cache
     modified_content = first_sync_content.replace(
         "**Category:** default", "**Category:** default\n\nModified content added here."
     )
     note_path.write_text(modified_content)
+    future = note_path.stat().st_mtime + 2
+    os.utime(note_path, (future, future))
 
     # Step 4: Second sync (should detect modification)
-    with patch.object(sys, "argv", ["sync", "--no-push"]):
-        with patch("src.sync.get_root_dir", return_value=tmp_path):
-            exit_code = sync_main()
+    buf = io.StringIO()
+    with redirect_stdout(buf):
+        exit_code = invoke_sync(["sync", "--no-push"])
 
     assert exit_code == 0
-    captured = capsys.readouterr()
-    assert "Found 1 modified note(s)" in captured.out
-    assert "Updated timestamps in 1 note(s)" in captured.out
-    assert "Changes committed" in captured.out
+    output = buf.getvalue()
+    assert "Found 1 modified note(s)" in output
+    assert "Updated timestamps in 1 note(s)" in output
+    assert "Changes committed" in output
 
     # Verify second commit
-    commits = list(git_repo_with_commit.iter_commits(max_count=3))
+    commits = _last_commits(tmp_path, 3)
     assert len(commits) == 3  # README + 2 sync commits
 
     # Verify modifications persisted
@@ -83,22 +93,24 @@ def test_integration_new_note_and_sync(
     assert not note_path.exists()
 
     # Step 6: Third sync (should detect and commit deletion)
-    with patch.object(sys, "argv", ["sync", "--no-push"]):
-        with patch("src.sync.get_root_dir", return_value=tmp_path):
-            exit_code = sync_main()
+    buf = io.StringIO()
+    with redirect_stdout(buf):
+        exit_code = invoke_sync(["sync", "--no-push"])
 
     assert exit_code == 0
-    captured = capsys.readouterr()
-    assert "Found 1 modified note(s)" in captured.out
-    assert "Changes committed" in captured.out
+    output = buf.getvalue()
+    assert "Found 1 modified note(s)" in output
+    assert "Changes committed" in output
 
     # Verify third commit for deletion
-    commits = list(git_repo_with_commit.iter_commits(max_count=4))
+    commits = _last_commits(tmp_path, 4)
     assert len(commits) == 4  # README + 3 sync commits
 
     # Verify the file is not in the repository anymore
     assert not note_path.exists()
     # Verify file is not in the git tree of the latest commit
-    tree = commits[0].tree
+    tracked = subprocess.check_output(
+        ["git", "-C", str(tmp_path), "ls-tree", "-r", "--name-only", "HEAD"], text=True
+    ).splitlines()
     note_relative_path = str(note_path.relative_to(tmp_path))
-    assert note_relative_path not in [item.path for item in tree.traverse()]
+    assert note_relative_path not in tracked
@@ -13,7 +13,6 @@ from src.new_note import (
     _replace_template_placeholders,
     _slugify,
     _write_note_content,
-    main,
 )
 
 
@@ -256,12 +255,10 @@ def test_parse_args_parses_all_arguments_together():
         assert args.summary == "Full test"
 
 
-def test_main_creates_note_successfully(tmp_path, note_template, monkeypatch, capsys):
-    monkeypatch.chdir(tmp_path)
-
-    with patch.object(sys, "argv", ["new_note.py", "Integration Test"]):
-        with patch("src.new_note.get_root_dir", return_value=tmp_path):
-            exit_code = main()
+def test_main_creates_note_successfully(
+    tmp_path, note_template, invoke_new_note, capsys
+):
+    exit_code = invoke_new_note(["new_note.py", "Integration Test"])
 
     assert exit_code == 0
 
@@ -282,12 +279,8 @@ def test_main_creates_note_successfully(tmp_path, note_template, monkeypatch, ca
     assert "general" in note_content
 
 
-def test_main_returns_error_when_template_missing(tmp_path, monkeypatch, capsys):
-    monkeypatch.chdir(tmp_path)
-
-    with patch.object(sys, "argv", ["new_note.py", "Test"]):
-        with patch("src.new_note.get_root_dir", return_value=tmp_path):
-            exit_code = main()
+def test_main_returns_error_when_template_missing(invoke_new_note, capsys):
+    exit_code = invoke_new_note(["new_note.py", "Test"])
 
     assert exit_code == 1
     captured = capsys.readouterr()
@@ -295,13 +288,9 @@ def test_main_returns_error_when_template_missing(tmp_path, monkeypatch, capsys)
 
 
 def test_main_creates_note_with_custom_metadata(
-    tmp_path, note_template, monkeypatch, capsys
+    tmp_path, note_template, invoke_new_note, capsys
 ):
-    monkeypatch.chdir(tmp_path)
-
-    with patch.object(
-        sys,
-        "argv",
+    exit_code = invoke_new_note(
         [
             "new_note.py",
             "Custom Note",
@@ -311,10 +300,8 @@ def test_main_creates_note_with_custom_metadata(
             "testing",
             "--summary",
             "Custom summary",
-        ],
-    ):
-        with patch("src.new_note.get_root_dir", return_value=tmp_path):
-            exit_code = main()
+        ]
+    )
 
     assert exit_code == 0
 
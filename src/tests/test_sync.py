@@ -1,13 +1,9 @@
-import sys
-from unittest.mock import patch
-
 import pytest
 
 from src.sync import (
     _add_note_to_list,
     _is_note_file,
     _update_timestamp_in_note,
-    main,
 )
 
 
@@ -101,10 +97,8 @@ def test_update_timestamp_in_note_handles_missing_file(tmp_path, capsys):
     assert "Warning" in captured.err
 
 
-def test_main_returns_error_when_not_in_git_repo(tmp_path, capsys):
-    with patch.object(sys, "argv", ["sync"]):
-        with patch("src.sync.get_root_dir", return_value=tmp_path):
-            exit_code = main()
+def test_main_returns_error_when_not_in_git_repo(invoke_sync, capsys):
+    exit_code = invoke_sync(["sync"])
 
     assert exit_code == 1
     captured = capsys.readouterr()
@@ -112,23 +106,21 @@ def test_main_returns_error_when_not_in_git_repo(tmp_path, capsys):
 
 
 def test_main_returns_zero_when_no_notes_modified(
-    tmp_path, git_repo_with_commit, capsys
+    invoke_sync, git_repo_with_commit, capsys
 ):
-    with patch.object(sys, "argv", ["sync"]):
-        with patch("src.sync.get_root_dir", return_value=tmp_path):
-            exit_code = main()
+    exit_code = invoke_sync(["sync"])
 
     assert exit_code == 0
     captured = capsys.readouterr()
     assert "No notes to sync" in captured.out
 
 
-def test_main_syncs_modified_notes(tmp_path, git_repo_with_commit, create_note, capsys):
+def test_main_syncs_modified_notes(
+    invoke_sync, git_repo_with_commit, create_note, capsys
+):
     create_note(content="Content")
 
-    with patch.object(sys, "argv", ["sync", "--no-push"]):
-        with patch("src.sync.get_root_dir", return_value=tmp_path):
-            exit_code = main()
+    exit_code = invoke_sync(["sync", "--no-push"])
 
     assert exit_code == 0
     captured = capsys.readouterr()
@@ -137,20 +129,20 @@ def test_main_syncs_modified_notes(tmp_path, git_repo_with_commit, create_note,
 
 
 def test_main_with_custom_commit_message(
-    tmp_path, git_repo_with_commit, create_note, capsys
+    invoke_sync, git_repo_with_commit, create_note, capsys
 ):
     create_note(content="Content")
 
-    with patch.object(sys, "argv", ["sync", "-m", "Custom message", "--no-push"]):
-        with patch("src.sync.get_root_dir", return_value=tmp_path):
-            exit_code = main()
+    exit_code = invoke_sync(["sync", "-m", "Custom message", "--no-push"])
 
     assert exit_code == 0
     captured = capsys.readouterr()
     assert "Committing: Custom message" in captured.out
 
 
-def test_main_handles_no_changes_after_staging(tmp_path, git_repo_with_commit, capsys):
+def test_main_handles_no_changes_after_staging(
+    invoke_sync, tmp_path, git_repo_with_commit, capsys
+):
     notes_dir = tmp_path / "notes" / "2025"
     notes_dir.mkdir(parents=True)
     note_path = notes_dir / "test-note.md"
@@ -159,17 +151,55 @@ def test_main_handles_no_changes_after_staging(tmp_path, git_repo_with_commit, c
     git_repo_with_commit.index.add([str(note_path)])
     git_repo_with_commit.index.commit("Add note without timestamp")
 
-    with patch.object(sys, "argv", ["sync"]):
-        with patch("src.sync.get_root_dir", return_value=tmp_path):
-            exit_code = main()
+    exit_code = invoke_sync(["sync"])
 
     assert exit_code == 0
     captured = capsys.readouterr()
     assert "Successfully pushed commits!" in captured.out
 
 
+def test_main_handles_staged_deletion(
+    invoke_sync, git_repo_with_commit, create_note, capsys
+):
+    # A note deleted via `git rm` is gone from both worktree and index;
+    # sync must not feed it to `git add` (which would fail the pathspec)
+    note_path = create_note(content="Content")
+    git_repo_with_commit.index.add([str(note_path)])
+    git_repo_with_commit.index.commit("Add note")
+    git_repo_with_commit.git.rm(str(note_path))
+
+    exit_code = invoke_sync(["sync", "--no-push"])
+
+    assert exit_code == 0
+    captured = capsys.readouterr()
+    assert "No notes to sync" in captured.out
+
+
+def test_main_syncs_renamed_note(
+    invoke_sync, git_repo_with_commit, create_note, capsys
+):
+    # `git mv` shows up as a staged rename; only the destination path may
+    # be staged - the source matches nothing in worktree or index
+    note_path = create_note(title="A", content="Content")
+    git_repo_with_commit.index.add([str(note_path)])
+    git_repo_with_commit.index.commit("Add note")
+    new_path = note_path.with_name("renamed-note.md")
+    git_repo_with_commit.git.mv(str(note_path), str(new_path))
+
+    exit_code = invoke_sync(["sync", "--no-push"])
+
+    assert exit_code == 0
+    captured = capsys.readouterr()
+    assert "Found 1 modified note(s)" in captured.out
+    assert "Changes committed" in captured.out
+
+    tracked = git_repo_with_commit.git.ls_tree("-r", "--name-only", "HEAD").splitlines()
+    assert "notes/2025/renamed-note.md" in tracked
+    assert "notes/2025/test-note.md" not in tracked
+
+
 def test_sync_only_stages_notes_not_other_files(
-    tmp_path, git_repo_with_commit, create_note, capsys
+    invoke_sync, tmp_path, git_repo_with_commit, create_note, capsys
 ):
     create_note(content="Content")
 
@@ -181,9 +211,7 @@ def test_sync_only_stages_notes_not_other_files(
     config_file = tmp_path / "_config.yml"
     config_file.write_text("config: value")
 
-    with patch.object(sys, "argv", ["sync", "--no-push"]):
-        with patch("src.sync.get_root_dir", return_value=tmp_path):
-            exit_code = main()
+    exit_code = invoke_sync(["sync", "--no-push"])
 
     assert exit_code == 0
     captured = capsys.readouterr()